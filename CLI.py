@@ -3,6 +3,7 @@ import argparse
 from modules.crawler import run_crawler
 from modules.processor import run_processor
 from modules.memory import run_memory
+from utils.storage import convert_records
 
 def main():
     parser = argparse.ArgumentParser(description="Web Scraping + Q&A CLI")
@@ -25,6 +26,11 @@ def main():
     question_parser = subparsers.add_parser("ask", help="Ask any question related to the website")
     question_parser.add_argument("query", nargs='?', default='', help="User query to be answered by the BOT")
 
+    # Convert subcommand
+    convert_parser = subparsers.add_parser("convert", help="Convert chunks / memory between .json and .rec")
+    convert_parser.add_argument("input_file", help="Input file (e.g. data/memory.rec)")
+    convert_parser.add_argument("output_file", help="Output file (e.g. data/memory.json)")
+
     args = parser.parse_args()
 
     if args.command == "crawl":
@@ -35,6 +41,8 @@ def main():
         run_memory()
     elif args.command == "ask":
         print(args.query, "\ncurrently untested!")
+    elif args.command == "convert":
+        convert_records(args.input_file, args.output_file)
     else:
         parser.print_help()
 
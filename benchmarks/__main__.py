@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import argparse
+
+from benchmarks.corpus import write_crawl_data
+from benchmarks.runner import BENCHMARKS, run_benchmarks, compare_results
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the processing + memory pipeline")
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Corpus options shared by run / generate
+    corpus_parser = argparse.ArgumentParser(add_help=False)
+    corpus_parser.add_argument("--pages", type=int, default=20, help="Synthetic pages to generate (default: 20)")
+    corpus_parser.add_argument("--page_size", type=int, default=20000, help="Characters of markdown per page (default: 20000)")
+    corpus_parser.add_argument("--duplication_rate", type=float, default=0.2, help="Chance a block repeats an earlier one (default: 0.2)")
+    corpus_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+
+    # Run subcommand
+    run_parser = subparsers.add_parser("run", parents=[corpus_parser], help="Run the benchmark suite")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Run only these benchmarks")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per benchmark (default: 5)")
+    run_parser.add_argument("--query", default="chatbot pricing plan", help="Query used for ranking / retrieval")
+    run_parser.add_argument("--top_k", type=int, default=50, help="top_k for process merging (default: 50)")
+    run_parser.add_argument("--memory_size", type=int, default=200, help="Memory entries for retrieval (default: 200)")
+    run_parser.add_argument("--records", type=int, default=5000, help="Memory records for the storage benchmarks (default: 5000)")
+    run_parser.add_argument("--ranked_size", type=int, default=50000, help="Ranked chunks for the merge benchmark (default: 50000)")
+    run_parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/<timestamp>.json)")
+
+    # Compare subcommand
+    compare_parser = subparsers.add_parser("compare", help="Flag regressions between two result files")
+    compare_parser.add_argument("baseline", help="Baseline results JSON")
+    compare_parser.add_argument("current", help="Current results JSON")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown ratio (default: 0.10)")
+    compare_parser.add_argument("--metric", default="median", choices=["min", "mean", "median"], help="Timing to compare (default: median)")
+
+    # Generate subcommand
+    generate_parser = subparsers.add_parser("generate", parents=[corpus_parser], help="Write a synthetic crawl_data.json")
+    generate_parser.add_argument("--output", default="benchmarks/results/crawl_data.json", help="Output file (default: benchmarks/results/crawl_data.json)")
+    generate_parser.add_argument("--force", action="store_true", help="Overwrite the output file if it exists")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        output = args.output or f"benchmarks/results/{time.strftime('%Y%m%d-%H%M%S')}.json"
+        run_benchmarks(args.only, args.pages, args.page_size, args.duplication_rate, args.seed,
+                       args.query, args.top_k, args.memory_size, args.records, args.ranked_size, args.repeat, output)
+    elif args.command == "compare":
+        rows = compare_results(args.baseline, args.current, args.threshold, args.metric)
+        regressions = [row["name"] for row in rows if row["status"] == "regression"]
+        missing = [row["name"] for row in rows if row["status"] == "missing"]
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+        if missing:
+            print(f"Missing from current run: {', '.join(missing)}")
+        if regressions or missing:
+            sys.exit(1)
+        print("No regressions.")
+    elif args.command == "generate":
+        if os.path.exists(args.output) and not args.force:
+            print(f"{args.output} already exists, pass --force to overwrite it.")
+            sys.exit(1)
+        write_crawl_data(args.output, pages=args.pages, page_size=args.page_size,
+                         duplication_rate=args.duplication_rate, seed=args.seed)
+        print(f"Synthetic crawl data saved to {args.output}")
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
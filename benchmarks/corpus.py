@@ -0,0 +1,91 @@
+import os
+import json
+import random
+
+# ----------------------------------------------------------------
+# synthetic crawl_data.json GENERATOR
+# ----------------------------------------------------------------
+
+WORDS = [
+    "chatbot", "pricing", "agent", "support", "lead", "booking", "automation", "platform",
+    "whatsapp", "instagram", "telegram", "website", "integration", "customer", "query",
+    "plan", "monthly", "annual", "storage", "training", "template", "campaign", "broadcast",
+    "analytics", "dashboard", "workflow", "ticket", "reply", "message", "contact", "team",
+    "the", "and", "with", "for", "your", "to", "of", "in", "on", "a", "is", "more",
+]
+
+NAV_ITEMS = ["AI Bots", "Product", "Solutions", "Pricing", "Partners", "Resources"]
+
+
+def _sentence(rng, min_words=6, max_words=18):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    words[0] = words[0].capitalize()
+    return " ".join(words) + rng.choice([".", ".", ".", "!", "?"])
+
+
+def _paragraph(rng, host):
+    kind = rng.random()
+    if kind < 0.15:
+        # Image links and bullet markers, like the crawler's nav blocks
+        icon = rng.choice(WORDS)
+        return "\n".join(
+            f"  * {item} ![{host} logo](https://cdn.{host}/assets/icons/{icon}.svg)"
+            for item in rng.sample(NAV_ITEMS, 3)
+        )
+    if kind < 0.35:
+        # Inline links plus camelCase joins for the clean_markdown regexes
+        page = rng.choice(WORDS)
+        return f"[{_sentence(rng, 3, 6)}](https://{host}/{page}){rng.choice(WORDS)}{rng.choice(WORDS).capitalize()} {_sentence(rng)}"
+    return " ".join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+
+
+def _table(rng):
+    return {
+        "headers": ["Item", "Price (per month)", "Price (per annum)"],
+        "rows": [[_sentence(rng, 2, 4), f"₹{rng.randint(1, 99) * 100}", f"₹{rng.randint(1, 99) * 1000}"] for _ in range(rng.randint(2, 5))],
+        "caption": "",
+        "summary": "",
+    }
+
+
+def generate_crawl_data(pages=20, page_size=20000, duplication_rate=0.2, seed=0, host="example.com"):
+    """ pages: int, page_size: int (chars per page), duplication_rate: float in [0, 1], seed: int """
+
+    if not 0 <= duplication_rate <= 1:
+        raise ValueError("duplication_rate must be between 0 and 1")
+
+    rng = random.Random(seed)
+    seen = []
+    data = {"URLS": [], "tables": [], "markdown": []}
+
+    for page in range(pages):
+        parts = []
+        size = 0
+        while size < page_size:
+            # Reuse an earlier block to mimic repeated headers / footers across pages
+            if seen and rng.random() < duplication_rate:
+                block = rng.choice(seen)
+            else:
+                block = _paragraph(rng, host)
+                seen.append(block)
+            parts.append(block)
+            size += len(block) + 2
+
+        data["URLS"].append(f"https://{host}/page-{page}")
+        data["tables"].append([_table(rng)] if rng.random() < 0.3 else [])
+        data["markdown"].append("\n\n".join(parts)[:page_size])
+
+    return data
+
+
+def write_crawl_data(output_file="data/crawl_data.json", **kwargs):
+    data = generate_crawl_data(**kwargs)
+
+    directory = os.path.dirname(output_file)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+
+    return data
@@ -0,0 +1,371 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import platform
+import tempfile
+import statistics
+import subprocess
+
+from benchmarks.corpus import write_crawl_data
+from utils.storage import RecordStore, load_records, save_records
+
+# ----------------------------------------------------------------
+# per-stage benchmark SETUPS
+# each setup gets the shared run state and returns a zero-arg callable
+# ----------------------------------------------------------------
+
+def _ranked_chunks(state):
+    # Deterministic stand-in for the TF-IDF ranking so merge timings don't depend on sklearn
+    from utils.chunking import SlidingWindowChunking
+
+    chunker = SlidingWindowChunking(window_size=120, step=60)
+    chunks = [(source, chunk) for source, md in enumerate(state["corpus"]["markdown"]) for chunk in chunker.chunk(md)]
+    rng = random.Random(state["seed"])
+    ranked = [(chunk, rng.random(), source, position) for position, (source, chunk) in enumerate(chunks)]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return ranked
+
+
+def setup_clean_markdown(state):
+    from modules.processor import WebScrapeProcessor
+
+    processor = WebScrapeProcessor(state["input_file"])
+    pages = state["corpus"]["markdown"]
+    return lambda: [processor.clean_markdown(md) for md in pages]
+
+
+def setup_chunking(state):
+    from utils.chunking import SlidingWindowChunking
+
+    text = " ".join(state["corpus"]["markdown"])
+    chunker = SlidingWindowChunking(window_size=512, step=256)
+    return lambda: chunker.chunk(text)
+
+
+def setup_similarity(state):
+    from utils.chunking import CosineSimilarityExtractor, SlidingWindowChunking
+
+    text = " ".join(state["corpus"]["markdown"])
+    chunks = SlidingWindowChunking(window_size=512, step=256).chunk(text)
+    return lambda: CosineSimilarityExtractor(state["query"]).find_relevant_chunks(chunks)
+
+
+def setup_process_merge(state):
+    from modules.processor import WebScrapeProcessor
+
+    ranked = _ranked_chunks(state)
+
+    class MergeOnlyProcessor(WebScrapeProcessor):
+        # Skip network, chunking and ranking so only the merge + save step is timed
+        def build_context(self):
+            self.sources = []
+            return ""
+
+        def chunk_sources(self, sources):
+            return [], []
+
+        def extract_relevant_chunks(self, chunks, sources=None):
+            return list(ranked)
+
+    processor = MergeOnlyProcessor(state["input_file"], query=state["query"])
+    output_file = os.path.join(state["workdir"], "chunks.rec")
+    return lambda: processor.process(output_file=output_file, top_k=state["top_k"])
+
+
+def setup_merge_ranked(state):
+    from utils.chunking import RankedChunkMerger
+
+    # Mostly short chunks (merged), with the odd very long one (split) well past the usual top_k
+    rng = random.Random(state["seed"])
+    words = " ".join(state["corpus"]["markdown"]).split()
+    pages = len(state["corpus"]["markdown"])
+    ranked = []
+    for position in range(state["ranked_size"]):
+        size = rng.randint(5000, 20000) if rng.random() < 0.01 else rng.randint(5, 400)
+        start = rng.randrange(max(1, len(words) - size))
+        source = position * pages // state["ranked_size"]
+        ranked.append((" ".join(words[start:start + size]), rng.random(), source, position))
+    ranked.sort(key=lambda x: x[1], reverse=True)
+
+    merger = RankedChunkMerger(min_size=500, max_size=1000)
+    return lambda: list(merger.merge(ranked))
+
+
+def setup_retrieve_memory(state):
+    from modules.chatbot import Chatbot
+    from benchmarks.stubs import StubTokenizer, StubEmbeddingModel
+
+    rng = random.Random(state["seed"])
+    text = " ".join(state["corpus"]["markdown"]).split()
+    memory = []
+    for _ in range(state["memory_size"]):
+        start = rng.randrange(max(1, len(text) - 60))
+        memory.append({"short_memory": " ".join(text[start:start + 60])})
+
+    # Bypass __init__ so no HF weights are downloaded
+    bot = Chatbot.__new__(Chatbot)
+    bot.memory = memory
+    bot.memory_texts = [item["short_memory"] for item in memory]
+    bot.embedding_tokenizer = StubTokenizer()
+    bot.embedding_model = StubEmbeddingModel(seed=state["seed"])
+    bot.memory_embeddings = bot._encode_memory(bot.memory_texts)
+
+    top_k = min(25, len(memory))
+    return lambda: bot.retrieve_memory(state["query"], top_k=top_k)
+
+
+# ----------------------------------------------------------------
+# memory file storage: indented JSON vs RecordStore
+# ----------------------------------------------------------------
+
+def load_memory_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_memory_records(path):
+    return load_records(path)
+
+
+def load_memory_summaries(path):
+    return load_records(path, columns=["short_memory"])
+
+
+def _memory_files(state):
+    # Written once per run and shared by the storage benchmarks
+    if "memory_json" not in state:
+        rng = random.Random(state["seed"])
+        words = " ".join(state["corpus"]["markdown"]).split()
+        labels = ["science_&_technology", "business_&_entrepreneurs", "learning_&_educational"]
+
+        records = []
+        for _ in range(state["records"]):
+            start = rng.randrange(max(1, len(words) - 160))
+            long_memory = " ".join(words[start:start + 160])
+            records.append({
+                "long_memory": long_memory,
+                "short_memory": " ".join(words[start:start + 40]),
+                "labels": rng.sample(labels, rng.randint(0, 2)),
+                "score": rng.random(),
+            })
+
+        state["memory_json"] = os.path.join(state["workdir"], "memory.json")
+        state["memory_rec"] = os.path.join(state["workdir"], "memory.rec")
+        save_records(state["memory_json"], records)
+        save_records(state["memory_rec"], records)
+
+    return state["memory_json"], state["memory_rec"]
+
+
+def setup_memory_load_json(state):
+    path, _ = _memory_files(state)
+    return lambda: load_memory_json(path)
+
+
+def setup_memory_load_records(state):
+    _, path = _memory_files(state)
+    return lambda: load_memory_records(path)
+
+
+def setup_memory_load_summaries(state):
+    _, path = _memory_files(state)
+    return lambda: load_memory_summaries(path)
+
+
+def setup_memory_random_access(state):
+    _, path = _memory_files(state)
+    store = RecordStore(path)
+    rng = random.Random(state["seed"])
+    ids = [rng.randrange(state["records"]) for _ in range(100)]
+    return lambda: [store.get(i) for i in ids]
+
+
+BENCHMARKS = {
+    "clean_markdown": setup_clean_markdown,
+    "chunking": setup_chunking,
+    "similarity": setup_similarity,
+    "process_merge": setup_process_merge,
+    "merge_ranked": setup_merge_ranked,
+    "retrieve_memory": setup_retrieve_memory,
+    "memory_load_json": setup_memory_load_json,
+    "memory_load_records": setup_memory_load_records,
+    "memory_load_summaries": setup_memory_load_summaries,
+    "memory_random_access": setup_memory_random_access,
+}
+
+# Loaders measured for peak RSS in a fresh interpreter: name -> (loader, file key)
+RSS_PROBES = {
+    "memory_load_json": ("load_memory_json", "memory_json"),
+    "memory_load_records": ("load_memory_records", "memory_rec"),
+    "memory_load_summaries": ("load_memory_summaries", "memory_rec"),
+}
+
+# ----------------------------------------------------------------
+# timing, results and comparison
+# ----------------------------------------------------------------
+
+def time_callable(fn, repeat=5, warmup=1):
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "repeat": repeat,
+    }
+
+
+_RSS_SCRIPT = """
+import sys
+
+def peak_kb():
+    # VmHWM is per process; ru_maxrss is inherited from the parent across exec on Linux
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+from benchmarks import runner
+before = peak_kb()
+records = getattr(runner, sys.argv[1])(sys.argv[2])
+after = peak_kb()
+print(after - before if before is not None else "")
+"""
+
+
+def measure_rss(loader, path):
+    """ Peak RSS growth (KB) of calling `loader(path)` in a fresh interpreter, None where unsupported """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", _RSS_SCRIPT, loader, path], cwd=root,
+                            capture_output=True, text=True, check=True).stdout.strip()
+    return int(output) if output else None
+
+
+def run_benchmarks(names=None, pages=20, page_size=20000, duplication_rate=0.2, seed=0,
+                   query="chatbot pricing plan", top_k=50, memory_size=200, records=5000, ranked_size=50000, repeat=5, output_file=None):
+    """ names: list of BENCHMARKS keys (default: all), output_file: str to save results JSON """
+
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    corpus_params = {"pages": pages, "page_size": page_size, "duplication_rate": duplication_rate, "seed": seed}
+    results = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        input_file = os.path.join(workdir, "crawl_data.json")
+        state = {
+            "corpus": write_crawl_data(input_file, **corpus_params),
+            "input_file": input_file,
+            "workdir": workdir,
+            "seed": seed,
+            "query": query,
+            "top_k": top_k,
+            "memory_size": memory_size,
+            "records": records,
+            "ranked_size": ranked_size,
+        }
+
+        for name in names:
+            logging.info(f"Running benchmark: {name}")
+            fn = BENCHMARKS[name](state)
+            results[name] = time_callable(fn, repeat=repeat)
+            line = f"{name:<22} median {results[name]['median'] * 1000:10.3f} ms  (min {results[name]['min'] * 1000:.3f} ms)"
+
+            if name in RSS_PROBES:
+                loader, key = RSS_PROBES[name]
+                results[name]["rss_kb"] = measure_rss(loader, state[key])
+                line += f"  rss +{results[name]['rss_kb']} KB"
+            print(line)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "corpus": corpus_params,
+            "query": query,
+            "top_k": top_k,
+            "memory_size": memory_size,
+            "records": records,
+            "ranked_size": ranked_size,
+        },
+        "results": results,
+    }
+
+    if output_file:
+        directory = os.path.dirname(output_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark results saved to {output_file}")
+
+    return report
+
+
+# meta fields that change the amount of work a benchmark does
+WORKLOAD_FIELDS = ["corpus", "query", "top_k", "memory_size", "records", "ranked_size"]
+
+
+def compare_results(baseline_file, current_file, threshold=0.10, metric="median"):
+    """ Returns a row per benchmark; status is 'regression', 'improvement', 'ok', 'missing' or 'new' """
+
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(current_file, "r", encoding="utf-8") as f:
+        current = json.load(f)
+
+    mismatched = [key for key in WORKLOAD_FIELDS if baseline["meta"].get(key) != current["meta"].get(key)]
+    if mismatched:
+        print(f"Warning: runs used different workloads ({', '.join(mismatched)}), timings may not be comparable.")
+
+    rows = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            # Renamed or crashed stages must not silently drop out of the check
+            rows.append({"name": name, "baseline": base[metric], "current": None, "ratio": None, "status": "missing"})
+            print(f"{name:<22} {base[metric] * 1000:10.3f} ms -> {'':>10}     MISSING")
+            continue
+        before = base[metric]
+        after = current["results"][name][metric]
+        ratio = after / before if before else float("inf")
+
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+
+        rows.append({"name": name, "baseline": before, "current": after, "ratio": ratio, "status": status})
+        print(f"{name:<22} {before * 1000:10.3f} ms -> {after * 1000:10.3f} ms  x{ratio:.2f}  {status.upper() if status == 'regression' else status}")
+
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            rows.append({"name": name, "baseline": None, "current": result[metric], "ratio": None, "status": "new"})
+            print(f"{name:<22} {'':>10}    -> {result[metric] * 1000:10.3f} ms         new")
+
+    return rows
@@ -0,0 +1,38 @@
+import zlib
+import torch
+
+from types import SimpleNamespace
+
+# ----------------------------------------------------------------
+# tiny offline stand-ins for the HF models
+# ----------------------------------------------------------------
+
+class StubTokenizer:
+    """ Hashes whitespace tokens into a fixed vocab, mirrors the HF call signature """
+
+    def __init__(self, vocab_size=4096, max_length=512):
+        self.vocab_size = vocab_size
+        self.max_length = max_length
+
+    def __call__(self, text, return_tensors="pt", truncation=True, padding=True, **kwargs):
+        words = text.split() or [""]
+        if truncation:
+            words = words[:self.max_length]
+        ids = [zlib.crc32(w.encode("utf-8")) % self.vocab_size for w in words]
+        input_ids = torch.tensor([ids], dtype=torch.long)
+        return {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+
+
+class StubEmbeddingModel(torch.nn.Module):
+    """ Single embedding layer returning `last_hidden_state` like AutoModel """
+
+    def __init__(self, vocab_size=4096, hidden_size=64, seed=0):
+        super().__init__()
+        generator = torch.Generator().manual_seed(seed)
+        self.embeddings = torch.nn.Embedding(vocab_size, hidden_size)
+        with torch.no_grad():
+            self.embeddings.weight.copy_(torch.randn(vocab_size, hidden_size, generator=generator))
+        self.eval()
+
+    def forward(self, input_ids, attention_mask=None, **kwargs):
+        return SimpleNamespace(last_hidden_state=self.embeddings(input_ids))
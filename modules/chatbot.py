@@ -1,15 +1,15 @@
-import json
 import torch
 import logging
 from huggingface_hub import InferenceClient
 from transformers import AutoTokenizer, AutoModelForSequenceClassification, BlenderbotTokenizer, BlenderbotForConditionalGeneration, AutoModel
 from transformers import AutoModelForSeq2SeqLM
 from transformers import pipeline
+from utils.storage import load_records
 
 
 class Chatbot:
     def __init__(self,
-                 memory_file="web_scraping/data/summaries.json",
+                 memory_file="data/memory.rec",
                  dialogue_model_path="facebook/blenderbot-400M-distill",
                  topic_model_path="cardiffnlp/tweet-topic-21-multi",
                  hf_token="your_token_here",
@@ -19,10 +19,9 @@ class Chatbot:
         logging.info("Initializing chatbot...")
 
         # Load memory
-        with open(memory_file, "r", encoding="utf-8") as f:
-            self.memory = json.load(f)
+        self.memory = load_records(memory_file, columns=["short_memory", "labels", "score"])
 
-        self.memory_texts = [item["summary"] for item in self.memory]
+        self.memory_texts = [item["short_memory"] for item in self.memory]
 
         # Use a basic tokenizer + embedding from transformer if sentence_transformers is not available
         self.embedding_tokenizer = AutoTokenizer.from_pretrained("bert-base-uncased")
@@ -87,7 +86,7 @@ class Chatbot:
 
         relevant_memories = self.retrieve_memory(user_input)
 
-        context = "\n".join([m["summary"] for m in relevant_memories])
+        context = "\n".join([m["short_memory"] for m in relevant_memories])
         dialogue_input = f"{context}\nUser: {user_input}"
 
         if self.use_local:
@@ -110,7 +109,7 @@ class Chatbot:
 
 
 if __name__ == "__main__":
-    bot = Chatbot(memory_file="web_scraping/data/summaries.json")
+    bot = Chatbot(memory_file="data/memory.rec")
 
     while True:
         user_input = input("You: ")
@@ -118,4 +117,4 @@ if __name__ == "__main__":
             break
         reply, memories = bot.chat(user_input)
         print("Bot:", reply)
-        print("Relevant Memories:", [m["summary"][:100] + "..." for m in memories])
+        print("Relevant Memories:", [m["short_memory"][:100] + "..." for m in memories])
@@ -1,9 +1,9 @@
-import json
 import logging
 
 from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM, AutoModelForSequenceClassification
 from huggingface_hub import InferenceClient
 from scipy.special import expit
+from utils.storage import load_records, save_records
 
 # Setup logging
 logging.basicConfig(filename="logger/summary.log", level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -85,10 +85,9 @@ class SummaryGenerator:
             logging.error(f"Failed to classify topic: {e}")
             return []
 
-    def summarize_chunks(self, input_file="data/chunks.json", output_file="data/memory.json"):
+    def summarize_chunks(self, input_file="data/chunks.rec", output_file="data/memory.rec"):
         try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
+            chunks = load_records(input_file, columns=["chunk", "score"])
 
             summaries = []
             for item in chunks:
@@ -103,8 +102,7 @@ class SummaryGenerator:
                     "score": item["score"],
                 })
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(summaries, f, indent=2, ensure_ascii=False)
+            save_records(output_file, summaries, columns=["long_memory", "short_memory", "labels", "score"])
 
             logging.info(f"Saved summaries to {output_file}")
         except Exception as e:
@@ -121,7 +119,7 @@ def run_memory(use_local=True, hf_token="your_token_here"):
         summarizer = SummaryGenerator(use_local=use_local)
 
     summarizer.summarize_chunks()
-    print("Update Memmory and topics saved to memory.json")
+    print("Update Memmory and topics saved to memory.rec")
 
 if __name__ == "__main__":
     run_memory()
@@ -3,9 +3,11 @@ import json
 import logging
 import requests
 
+from itertools import islice
 from bs4 import BeautifulSoup
 from utils.chunking import RegexChunking, SlidingWindowChunking, MultiLevelChunking
-from utils.chunking import CosineSimilarityExtractor
+from utils.chunking import CosineSimilarityExtractor, RankedChunkMerger
+from utils.storage import save_records
 
 # Setup logging
 logging.basicConfig(filename="logger\extractor.log", level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -79,21 +81,24 @@ class WebScrapeProcessor:
 
     def build_context(self):
         urls_info = self.extract_core_info(self.data.get("URLS", []))
+        table_info = self.flatten_tables()
 
-        markdown_info = ""
+        # One source per section: tables, url info, then each markdown page
+        self.sources = [table_info, urls_info]
         for md in self.data.get("markdown", []):
-            markdown_info += self.clean_markdown(md)
+            self.sources.append(self.clean_markdown(md))
 
-        table_info = self.flatten_tables()
-        self.total_context = table_info + urls_info + markdown_info
+        self.total_context = "".join(self.sources)
         return self.total_context
 
-    def chunk_text(self, text):
-        text_length = len(text)
-
+    def window_sizes(self, text_length):
         # Heuristic for dynamic chunking sizes
         window_size = max(512, min(2048, text_length // 10 * 2))
         step = max(128, min(window_size // 2, text_length // 20 * 2))
+        return window_size, step
+
+    def chunk_text(self, text, text_length=None):
+        window_size, step = self.window_sizes(text_length or len(text))
 
         logging.info(f"Using window_size={window_size}, step={step} for sliding window chunking.")
 
@@ -109,57 +114,56 @@ class WebScrapeProcessor:
         logging.info(f"Chunked text into {len(chunks)} pieces.")
         return chunks
 
-    def extract_relevant_chunks(self, chunks):
+    def chunk_sources(self, sources):
+        # Window sizes follow the whole context, but no chunk spans two sources
+        total_length = sum(len(text) for text in sources)
+        window_size, step = self.window_sizes(total_length)
+
+        chunks = []
+        chunk_sources = []
+        for source, text in enumerate(sources):
+            pieces = self.chunk_text(text, total_length)
+            words = text.split()
+            if not pieces and words:
+                # Shorter than one window, keep it whole instead of dropping it
+                pieces = [" ".join(words)]
+            elif (len(words) - window_size) % step:
+                # The sliding window only emits full windows, add the last one so the end of the source is kept
+                pieces.append(" ".join(words[-window_size:]))
+            chunks.extend(pieces)
+            chunk_sources.extend([source] * len(pieces))
+
+        return chunks, chunk_sources
+
+    def extract_relevant_chunks(self, chunks, sources=None):
+        sources = sources or [0] * len(chunks)
         extractor = CosineSimilarityExtractor(self.query)
-        relevant_chunks = extractor.find_relevant_chunks(chunks)
+        relevant_chunks = [
+            (chunk, score, sources[position], position)
+            for position, (chunk, score) in enumerate(extractor.find_relevant_chunks(chunks))
+        ]
         relevant_chunks.sort(key=lambda x: x[1], reverse=True)
         logging.info(f"Top relevant chunk score: {relevant_chunks[0][1] if relevant_chunks else 'N/A'}")
         return relevant_chunks
 
 
-    def process(self, output_file="data/chunks.json", top_k=50, query=None):
+    def process(self, output_file="data/chunks.rec", top_k=50, query=None):
         logging.info("Processing started...")
         
         if query is not None:
             self.query = query
 
-        context = self.build_context()
-        chunks = self.chunk_text(context)
-        relevant_chunks = self.extract_relevant_chunks(chunks)
-
-        merged_chunks = []
-        buffer = ""
-        buffer_score = 0
-        count = 0
-
-        for chunk, score in relevant_chunks:
-            if count >= top_k:
-                break
-            if len(buffer) + len(chunk) < 500:
-                buffer += " " + chunk
-                buffer_score = max(buffer_score, score)
-            else:
-                if buffer:
-                    merged_chunks.append({"chunk": buffer.strip(), "score": buffer_score})
-                    count += 1
-                buffer = chunk
-                buffer_score = score
-
-            while len(buffer) > 1000 and count < top_k:
-                split_point = buffer.rfind(" ", 0, 1000)
-                if split_point == -1:
-                    split_point = 1000
-                merged_chunks.append({"chunk": buffer[:split_point].strip(), "score": buffer_score})
-                buffer = buffer[split_point:].strip()
-                count += 1
-
-        if buffer and count < top_k:
-            merged_chunks.append({"chunk": buffer.strip(), "score": buffer_score})
+        self.build_context()
+        chunks, sources = self.chunk_sources(self.sources)
+        relevant_chunks = self.extract_relevant_chunks(chunks, sources)
+
+        # Lazy merge, stops pulling ranked chunks once top_k merged chunks exist
+        merger = RankedChunkMerger(min_size=500, max_size=1000)
+        merged_chunks = list(islice(merger.merge(relevant_chunks), top_k))
 
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(merged_chunks, f, indent=2, ensure_ascii=False)
+            save_records(output_file, merged_chunks, columns=["chunk", "score"])
             logging.info(f"Saved top {top_k} relevant chunks to {output_file}")
         except Exception as e:
             logging.error(f"Failed to save output: {e}")
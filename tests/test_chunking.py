@@ -0,0 +1,90 @@
+import os
+import unittest
+from itertools import count, islice
+
+from modules.processor import WebScrapeProcessor
+from utils.chunking import RankedChunkMerger
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+class RankedChunkMergerTest(unittest.TestCase):
+    def setUp(self):
+        self.merger = RankedChunkMerger(min_size=500, max_size=1000)
+
+    def test_group_joined_by_position_not_score(self):
+        ranked = [("c" * 100, 0.9, 0, 5), ("a" * 100, 0.8, 0, 1), ("b" * 100, 0.7, 0, 3)]
+        merged = list(self.merger.merge(ranked))
+
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]["chunk"], " ".join(["a" * 100, "b" * 100, "c" * 100]))
+        self.assertEqual(merged[0]["score"], 0.9)
+
+    def test_sources_are_not_merged(self):
+        ranked = [("a" * 100, 0.9, 0, 0), ("b" * 100, 0.8, 1, 1), ("c" * 100, 0.7, 1, 2)]
+        merged = [m["chunk"] for m in self.merger.merge(ranked)]
+
+        self.assertEqual(merged, ["a" * 100, "b" * 100 + " " + "c" * 100])
+
+    def test_chunks_at_most_max_size(self):
+        ranked = [(" ".join(["word"] * n), 1 - i / 100, i % 3, i) for i, n in enumerate(range(5, 2000, 37))]
+        merged = list(self.merger.merge(ranked))
+
+        self.assertTrue(merged)
+        for m in merged:
+            self.assertTrue(0 < len(m["chunk"]) <= 1000)
+
+    def test_no_text_lost_across_splits(self):
+        text = " ".join(f"w{i}" for i in range(3000))
+        merged = list(self.merger.merge([(text, 1.0, 0, 0)]))
+
+        self.assertGreater(len(merged), 1)
+        self.assertEqual(" ".join(m["chunk"] for m in merged).split(), text.split())
+
+    def test_hard_cut_without_spaces(self):
+        merged = list(self.merger.merge([("x" * 2500, 1.0, 0, 0)]))
+
+        self.assertEqual([len(m["chunk"]) for m in merged], [1000, 1000, 500])
+
+    def test_empty_and_whitespace_input(self):
+        self.assertEqual(list(self.merger.merge([])), [])
+        self.assertEqual(list(self.merger.merge([("   \n\t ", 1.0, 0, 0)])), [])
+
+        merged = list(self.merger.merge([("  " + "x" * 2000, 1.0, 0, 0)]))
+        self.assertEqual([len(m["chunk"]) for m in merged], [1000, 1000])
+
+    def test_lazy_under_islice(self):
+        infinite = (("word " * 300, 1.0, 0, i) for i in count())
+        merged = list(islice(self.merger.merge(infinite), 5))
+
+        self.assertEqual(len(merged), 5)
+
+
+class ChunkSourcesTest(unittest.TestCase):
+    def setUp(self):
+        self.processor = WebScrapeProcessor(os.path.join(DATA_DIR, "crawl_data.json"))
+
+    def assert_source_ends_kept(self, sources):
+        chunks, chunk_sources = self.processor.chunk_sources(sources)
+
+        self.assertEqual(len(chunks), len(chunk_sources))
+        for source, text in enumerate(sources):
+            own = [chunk for chunk, s in zip(chunks, chunk_sources) if s == source]
+            self.assertTrue(own, f"source {source} produced no chunks")
+            self.assertTrue(any(chunk.split()[-1] == text.split()[-1] for chunk in own), f"end of source {source} dropped")
+
+    def test_last_word_of_every_source_kept(self):
+        # Unique words, sizes below, at and between multiples of the 2048 / 1024 window
+        sources = [" ".join(f"s{source}w{i}" for i in range(n)) for source, n in enumerate([100, 2048, 2500, 3072, 3100, 5000])]
+        self.assertEqual(self.processor.window_sizes(sum(len(text) for text in sources)), (2048, 1024))
+
+        self.assert_source_ends_kept(sources)
+
+    def test_last_word_of_shipped_pages_kept(self):
+        sources = [self.processor.clean_markdown(md) for md in self.processor.data["markdown"]]
+
+        self.assert_source_ends_kept(sources)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from utils import storage
+from utils.storage import RecordStore, load_records, save_records
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+class RecordStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "memory.rec")
+        with open(os.path.join(DATA_DIR, "memory.json"), "r", encoding="utf-8") as f:
+            self.records = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_json_round_trip(self):
+        save_records(self.path, self.records)
+        exported = os.path.join(self.tmp, "memory.json")
+        with RecordStore(self.path) as store:
+            store.export_json(exported)
+
+        self.assertEqual(load_records(self.path), self.records)
+        self.assertEqual(load_records(exported), self.records)
+
+    def test_get_by_id(self):
+        save_records(self.path, self.records)
+        with RecordStore(self.path) as store:
+            self.assertEqual(store.get(3), self.records[3])
+            self.assertEqual(store.get(-1), self.records[-1])
+            with self.assertRaises(IndexError):
+                store.get(len(self.records))
+            with self.assertRaises(IndexError):
+                store.get(-len(self.records) - 1)
+
+    def test_column_projection(self):
+        save_records(self.path, self.records)
+        projected = load_records(self.path, columns=["short_memory", "score"])
+
+        self.assertEqual(projected, [{"short_memory": r["short_memory"], "score": r["score"]} for r in self.records])
+        with RecordStore(self.path) as store:
+            self.assertEqual(store.column("labels"), [r["labels"] for r in self.records])
+
+    def test_append_after_read(self):
+        save_records(self.path, self.records)
+        extra = {"long_memory": "new", "short_memory": "new", "labels": [], "score": 1.0}
+        with RecordStore(self.path) as store:
+            store.read()
+            store.append(extra)
+            self.assertEqual(len(store), len(self.records) + 1)
+            self.assertEqual(store.get(-1), extra)
+            self.assertEqual(store.read(), self.records + [extra])
+
+        self.assertEqual(load_records(self.path), self.records + [extra])
+
+    def test_empty_store(self):
+        save_records(self.path, [], columns=["chunk", "score"])
+        with RecordStore(self.path) as store:
+            self.assertEqual(len(store), 0)
+            self.assertEqual(store.read(), [])
+            with self.assertRaises(IndexError):
+                store.get(0)
+
+        with self.assertRaises(ValueError):
+            save_records(self.path, [])
+
+    def test_non_ascii_text(self):
+        records = [{"chunk": "₹600 – naïve 日本語 ✓", "score": 0.5}, {"chunk": "", "score": None}]
+        save_records(self.path, records)
+
+        self.assertEqual(load_records(self.path), records)
+
+    def test_columns_from_all_records(self):
+        save_records(self.path, [{"a": 1}, {"b": 2}])
+
+        self.assertEqual(load_records(self.path), [{"a": 1, "b": None}, {"a": None, "b": 2}])
+        with self.assertRaises(ValueError):
+            save_records(self.path, [{"a": 1, "c": 3}], columns=["a"])
+
+    def test_release_path_on_large_file(self):
+        records = [{"text": "ü" * 2000 + str(i), "n": i} for i in range(2000)]
+        save_records(self.path, records)
+
+        self.assertGreater(os.path.getsize(self.path), 2 * storage._RELEASE)
+        with RecordStore(self.path) as store:
+            self.assertEqual(store.read(), records)
+            self.assertEqual(store.get(0), records[0])
+
+    def test_failed_save_keeps_old_store(self):
+        save_records(self.path, self.records)
+        with self.assertRaises(TypeError):
+            save_records(self.path, [{"long_memory": object()}])
+
+        self.assertEqual(load_records(self.path), self.records)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_truncated_file_rejected(self):
+        save_records(self.path, self.records)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 4)
+
+        with self.assertRaises(ValueError):
+            RecordStore(self.path)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            load_records(os.path.join(self.tmp, "missing.rec"))
+
+        fallback = os.path.join(self.tmp, "chunks.json")
+        save_records(fallback, [{"chunk": "a", "score": 1.0}])
+        self.assertEqual(load_records(os.path.join(self.tmp, "chunks.rec")), [{"chunk": "a", "score": 1.0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,6 +62,58 @@ class CosineSimilarityExtractor:
         similarities = cosine_similarity(vectors[0:1], vectors[1:]).flatten()
         return [(chunks[i], similarities[i]) for i in range(len(chunks))]
 
+class RankedChunkMerger:
+    """ Streams score-ordered (chunk, score, source, position) tuples into merged chunks of at most max_size chars """
+
+    def __init__(self, min_size=500, max_size=1000):
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def merge(self, ranked_chunks):
+        group = []
+        group_size = 0
+        group_score = 0
+        group_source = None
+
+        for chunk, score, source, position in ranked_chunks:
+            # Only neighbours from the same source are merged
+            if group and (source != group_source or group_size + len(chunk) >= self.min_size):
+                yield from self._split(group, group_score)
+                group = []
+                group_size = 0
+
+            if not group:
+                group_score = score
+                group_source = source
+            group.append((position, chunk))
+            group_size += len(chunk) + 1
+            group_score = max(group_score, score)
+
+        if group:
+            yield from self._split(group, group_score)
+
+    def _split(self, group, score):
+        # Small neighbours are joined in document order, then cut by offset instead of re-slicing the tail
+        text = " ".join(chunk for _, chunk in sorted(group, key=lambda x: x[0]))
+        start = 0
+        end = len(text)
+        while start < end and text[start].isspace():
+            start += 1
+
+        while end - start > self.max_size:
+            split_point = text.rfind(" ", start, start + self.max_size)
+            if split_point <= start:
+                split_point = start + self.max_size
+            yield {"chunk": text[start:split_point].strip(), "score": score}
+
+            start = split_point
+            while start < end and text[start].isspace():
+                start += 1
+
+        tail = text[start:].strip()
+        if tail:
+            yield {"chunk": tail, "score": score}
+
 
 if __name__ == "__main__":
     # Example Workflow
@@ -108,4 +160,11 @@ if __name__ == "__main__":
     # Print top 5 most relevant chunks
     print(f"Found {len(multi_chunks)} chunks, showing top 5 most relevant:")
     for i, (chunk, similarity) in enumerate(relevant_chunks[:5]):
-        print(f"{i+1}. Similarity: {similarity:.4f} - '{chunk[:75]}...'")
\ No newline at end of file
+        print(f"{i+1}. Similarity: {similarity:.4f} - '{chunk[:75]}...'")
+
+    # Merge the ranked chunks back into passages, document order within each merge
+    ranked = [(chunk, similarity, 0, position) for position, (chunk, similarity) in enumerate(extractor.find_relevant_chunks(multi_chunks))]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    merger = RankedChunkMerger(min_size=100, max_size=200)
+    for merged in merger.merge(ranked):
+        print(f"{merged['score']:.4f} - '{merged['chunk'][:75]}...'")
\ No newline at end of file
@@ -0,0 +1,281 @@
+
+# ----------------------------------------------------------------
+# record storage HELPER
+# ----------------------------------------------------------------
+#
+# <name>.rec  MAGIC | uint32 header length | JSON column list | fields... | index | footer
+#
+# index   one fixed-width entry per record: (uint64 offset, uint32 length) per column
+# footer  uint64 index offset | uint64 record count | END_MAGIC
+#
+# Every field is a 1-byte tag + payload: b"s" raw utf-8 text, b"j" compact JSON.
+# The file is mmap'd, so a record or a single column can be read without
+# touching the rest of it. Keeping the index inside the same file means a
+# save is a single os.replace.
+
+import os
+import json
+import mmap
+import struct
+import logging
+
+MAGIC = b"AWBREC2\n"
+END_MAGIC = b"AWBEND2\n"
+_TEXT = ord("s")
+# Mapped pages already decoded are dropped every _RELEASE bytes during a full read
+_RELEASE = 1 << 20
+_HEADER_LENGTH = struct.Struct("<I")
+_FOOTER = struct.Struct("<QQ8s")
+
+
+def _encode(value):
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8")
+    return b"j" + json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(buffer):
+    payload = buffer[1:]
+    if buffer[0:1] == b"s":
+        return payload.decode("utf-8")
+    return json.loads(payload)
+
+
+class RecordStore:
+    def __init__(self, path, columns=None):
+        self.path = path
+        self._file = None
+        self._map = None
+
+        if os.path.exists(self.path):
+            self.columns = self._read_header()
+            if columns is not None and list(columns) != self.columns:
+                raise ValueError(f"{path} has columns {self.columns}, expected {list(columns)}")
+            self._entry = struct.Struct("<" + "QI" * len(self.columns))
+            self._index_offset, self._count = self._read_footer()
+        else:
+            if not columns:
+                raise FileNotFoundError(f"No record store at {path}, columns are required to create one")
+            self.columns = list(columns)
+            self._entry = struct.Struct("<" + "QI" * len(self.columns))
+            self._write_header()
+
+    def _read_header(self):
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a record store file")
+            (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+            self._header_size = len(MAGIC) + _HEADER_LENGTH.size + length
+            return json.loads(f.read(length).decode("utf-8"))
+
+    def _read_footer(self):
+        size = os.path.getsize(self.path)
+        if size < self._header_size + _FOOTER.size:
+            raise ValueError(f"{self.path} is truncated")
+
+        with open(self.path, "rb") as f:
+            f.seek(size - _FOOTER.size)
+            index_offset, count, end = _FOOTER.unpack(f.read(_FOOTER.size))
+
+        # The footer must describe exactly the bytes in front of it
+        if end != END_MAGIC or index_offset + count * self._entry.size + _FOOTER.size != size:
+            raise ValueError(f"{self.path} is truncated or corrupt")
+        return index_offset, count
+
+    def _write_header(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        header = json.dumps(self.columns).encode("utf-8")
+        self._header_size = len(MAGIC) + _HEADER_LENGTH.size + len(header)
+        self._index_offset = self._header_size
+        self._count = 0
+
+        with open(self.path, "wb") as f:
+            f.write(MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            f.write(_FOOTER.pack(self._index_offset, 0, END_MAGIC))
+
+    def _data(self):
+        if self._map is None:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _positions(self, columns):
+        if columns is None:
+            return list(enumerate(self.columns))
+        unknown = [c for c in columns if c not in self.columns]
+        if unknown:
+            raise KeyError(f"Unknown columns: {', '.join(unknown)}")
+        return [(self.columns.index(c), c) for c in columns]
+
+    def _record(self, data, entry, positions):
+        return {name: _decode(data[entry[2 * i]:entry[2 * i] + entry[2 * i + 1]]) for i, name in positions}
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.read())
+
+    def append(self, record):
+        self.extend([record])
+
+    def extend(self, records):
+        # Existing map would not see the new bytes, reopen on next read
+        self.close()
+
+        with open(self.path, "r+b") as f:
+            f.seek(self._index_offset)
+            index = f.read(self._count * self._entry.size)
+
+            # New fields go where the index was, then the index and footer are rewritten after them
+            f.seek(self._index_offset)
+            offset = self._index_offset
+            entries = []
+            for record in records:
+                entry = []
+                for column in self.columns:
+                    field = _encode(record.get(column))
+                    f.write(field)
+                    entry += [offset, len(field)]
+                    offset += len(field)
+                entries.append(self._entry.pack(*entry))
+
+            f.write(index + b"".join(entries))
+            f.write(_FOOTER.pack(offset, self._count + len(entries), END_MAGIC))
+            f.truncate()
+
+        self._index_offset = offset
+        self._count += len(entries)
+
+    def get(self, record_id, columns=None):
+        if record_id < 0:
+            record_id += self._count
+        if not 0 <= record_id < self._count:
+            raise IndexError(f"record id {record_id} out of range")
+
+        data = self._data()
+        entry = self._entry.unpack_from(data, self._index_offset + record_id * self._entry.size)
+        return self._record(data, entry, self._positions(columns))
+
+    def read(self, columns=None):
+        if self._count == 0:
+            return []
+
+        positions = self._positions(columns)
+        data = self._data()
+        index = data[self._index_offset:self._index_offset + self._count * self._entry.size]
+        can_release = hasattr(data, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+        released = 0
+
+        # Text is decoded straight from the mapping, JSON fields are parsed in one json.loads at the end
+        records = []
+        pending = []
+        with memoryview(data) as view:
+            for entry in self._entry.iter_unpack(index):
+                record = {}
+                for i, name in positions:
+                    start = entry[2 * i]
+                    end = start + entry[2 * i + 1]
+                    if view[start] == _TEXT:
+                        record[name] = str(view[start + 1:end], "utf-8")
+                    else:
+                        record[name] = None
+                        pending.append((record, name, bytes(view[start + 1:end])))
+                records.append(record)
+
+                # Records are laid out in index order, so everything before this one is decoded
+                done = (entry[-2] + entry[-1]) // mmap.PAGESIZE * mmap.PAGESIZE
+                if can_release and done - released >= _RELEASE:
+                    data.madvise(mmap.MADV_DONTNEED, released, done - released)
+                    released = done
+
+        if pending:
+            decoded = json.loads(b"[" + b",".join(field for _, _, field in pending) + b"]")
+            for (record, name, _), value in zip(pending, decoded):
+                record[name] = value
+        return records
+
+    def column(self, name):
+        return [record[name] for record in self.read([name])]
+
+    def export_json(self, output_file):
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(self.read(), f, indent=2, ensure_ascii=False)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._map = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def save_records(output_file, records, columns=None):
+    """ Writes a .json file as before, anything else as a fresh RecordStore """
+
+    if output_file.endswith(".json"):
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        return
+
+    # Every key of every record, in first-seen order
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    if columns is None:
+        columns = keys
+    else:
+        unknown = [key for key in keys if key not in columns]
+        if unknown:
+            raise ValueError(f"Records have keys not in columns: {', '.join(unknown)}")
+    if not columns:
+        raise ValueError("columns are required to save an empty record store")
+
+    # Build next to the target and swap in, so a failed write keeps the old store
+    tmp_file = output_file + ".tmp"
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+
+    try:
+        with RecordStore(tmp_file, columns) as store:
+            store.extend(records)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+    os.replace(tmp_file, output_file)
+
+
+def load_records(input_file, columns=None):
+    if not os.path.exists(input_file):
+        # The repo ships data/*.json, use them until a .rec has been written
+        fallback = os.path.splitext(input_file)[0] + ".json"
+        if input_file.endswith(".json") or not os.path.exists(fallback):
+            raise FileNotFoundError(f"No such file: {input_file}")
+        logging.info(f"{input_file} not found, loading {fallback} instead.")
+        input_file = fallback
+
+    if input_file.endswith(".json"):
+        with open(input_file, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        if columns is None:
+            return records
+        return [{c: record.get(c) for c in columns} for record in records]
+
+    with RecordStore(input_file) as store:
+        return store.read(columns)
+
+
+def convert_records(input_file, output_file):
+    records = load_records(input_file)
+    save_records(output_file, records)
+    print(f"Converted {len(records)} records from {input_file} to {output_file}")